@@ -0,0 +1,82 @@
+"""
+Compare the eager and streaming ways of reading a large collection page.
+
+A local HTTP server serves a synthetic page of devices and each mode runs
+in a fresh process, so the peak RSS it reports is its own.
+
+    python examples/benchmark_streaming.py [number of items]
+"""
+import json
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+from gooee import GooeeClient
+
+
+def peak_rss_mib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak / (2.0 ** 20 if sys.platform == 'darwin' else 2.0 ** 10)
+
+
+def measure(url, stream):
+    client = GooeeClient(url)
+    baseline = peak_rss_mib()
+
+    start = time.time()
+    response = client.get('/devices', stream=stream)
+    items = response.iter_items()
+    next(items)
+    first = time.time() - start
+    count = 1 + sum(1 for _ in items)
+    total = time.time() - start
+
+    print('{:<6} items={} first item={:.1f}ms total={:.0f}ms peak RSS={:.1f}MiB (+{:.1f}MiB)'.format(
+        'stream' if stream else 'eager', count, first * 1000, total * 1000,
+        peak_rss_mib(), peak_rss_mib() - baseline))
+
+
+def serve(count):
+    class Handler(BaseHTTPRequestHandler):
+        wbufsize = 64 * 1024
+
+        def do_GET(self):
+            # Generate the page on the fly so that this process stays small;
+            # a child process inherits its peak RSS.
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(b'[')
+            for i in range(count):
+                device = {'id': 'device-{:06d}'.format(i), 'name': 'Device {}'.format(i),
+                          'meta': {'index': i, 'tags': ['a', 'b']}}
+                separator = ', ' if i else ''
+                self.wfile.write((separator + json.dumps(device)).encode('utf-8'))
+            self.wfile.write(b']')
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    print('Serving {} devices'.format(count))
+    return server
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--measure']:
+        measure(sys.argv[2], sys.argv[3] == 'stream')
+        sys.exit()
+
+    server = serve(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
+    url = 'http://127.0.0.1:{}/'.format(server.server_port)
+    for mode in ('eager', 'stream'):
+        subprocess.check_call([sys.executable, __file__, '--measure', url, mode])
+    server.shutdown()
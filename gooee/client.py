@@ -15,13 +15,13 @@ from __future__ import unicode_literals
 
 from platform import platform
 
-import requests
 from six import string_types
 
 from .compat import json
 from .decorators import resource
 from .exceptions import IllegalHttpMethod, GooeeException
 from . import __version__
+from .transports import RequestsTransport
 from .utils import (
     format_path,
     GOOEE_API_URL
@@ -33,12 +33,14 @@ class GooeeClient(object):
 
     allowed_methods = ('get', 'post', 'put', 'patch', 'delete', 'options')
 
-    def __init__(self, api_base_url=GOOEE_API_URL):
+    def __init__(self, api_base_url=GOOEE_API_URL, transport=None):
         self.api_base_url = api_base_url
+        self.transport = transport or RequestsTransport()
         self.auth_token = ''
         self.api_token = ''
 
-    def _request(self, method, path, headers=None, data=None, params=None):
+    def _request(self, method, path, headers=None, data=None, params=None,
+                 stream=False):
         """Request helper."""
         if method not in self.allowed_methods:
             msg = 'HTTP method {} not supported. Needs to be one of: {}'.format(
@@ -55,8 +57,9 @@ class GooeeClient(object):
         if data and not isinstance(data, string_types):
             data = json.dumps(data)
 
-        response = getattr(requests, method)(
-            url, headers=headers_final, data=data, params=params)
+        response = self.transport.request(
+            method, url, headers=headers_final, data=data, params=params,
+            stream=stream)
 
         return response
 
@@ -103,8 +106,9 @@ class GooeeClient(object):
         return headers
 
     @resource
-    def get(self, path, params=None):
-        return self._request('get', path, params=params)
+    def get(self, path, params=None, stream=False, headers=None):
+        return self._request('get', path, headers=headers, params=params,
+                             stream=stream)
 
     @resource
     def post(self, path, headers=None, data=None, params=None):
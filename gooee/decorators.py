@@ -12,10 +12,9 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import functools
+import inspect
 
-import requests
-
-from .exceptions import InternetConnectionError
+from .exceptions import CONNECTION_ERRORS, InternetConnectionError
 from .models import Resource
 
 
@@ -26,9 +25,10 @@ def resource(func):
     def wrapper(*args, **kwargs):
         try:
             response = func(*args, **kwargs)
-        except requests.exceptions.ConnectionError as e:
+        except CONNECTION_ERRORS as e:
             raise InternetConnectionError(e)
 
-        return Resource(response)
+        stream = inspect.getcallargs(func, *args, **kwargs).get('stream', False)
+        return Resource(response, stream=stream)
 
     return wrapper
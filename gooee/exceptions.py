@@ -11,7 +11,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
-from requests.exceptions import ConnectionError
+from requests.exceptions import ChunkedEncodingError, ConnectionError
 
 
 class GooeeException(Exception):
@@ -35,9 +35,18 @@ class UnsupportedEndpoint(GooeeException):
     pass
 
 
+class UnrecordedRequest(GooeeException):
+    pass
+
+
 class InternetConnectionError(ConnectionError):
     """
     Wraps requests.exceptions.ConnectionError in order to provide a more
     intuitively named exception.
     """
     pass
+
+
+# Errors of requests wrapped in InternetConnectionError, whether they happen
+# while sending the request or while reading a streamed body.
+CONNECTION_ERRORS = (ConnectionError, ChunkedEncodingError)
@@ -12,24 +12,41 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 from .compat import json
+from .exceptions import CONNECTION_ERRORS, InternetConnectionError
+from .utils import iter_json_array
+
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class Resource(object):
-    """Objectify a Response."""
+    """
+    Objectify a Response.
 
-    def __init__(self, response):
+    When ``stream`` is true the body of a successful response is left
+    unread: ``json`` and ``text`` are ``None`` and the items are consumed
+    through ``iter_items``. The connection is released once the items have
+    been consumed, or by ``close``, which ``with`` calls on exit. Error
+    responses are always read so their body stays available.
+    """
+
+    def __init__(self, response, stream=False):
+        self.stream = stream and 200 <= response.status_code < 300
+
+        if self.stream:
+            self.json = self.text = None
+        else:
+            try:
+                self.json = response.json()
+            except json.decoder.JSONDecodeError:
+                # This happens on a DELETE or a response that returns
+                # nothing. We could improve this to only raise when it isn't
+                # that case... but we'd need to know it was expected... or
+                # not. This would also occur when DJANGO is in DEBUG mode
+                # and the traceback webpage is returned in the response.
+                self.json = None
+
+            self.text = response.text
 
-        try:
-            self.json = response.json()
-        except json.decoder.JSONDecodeError:
-            # This happens on a DELETE or a response that returns
-            # nothing. We could improve this to only raise when it isn't
-            # that case... but we'd need to know it was expected... or
-            # not. This would also occur when DJANGO is in DEBUG mode
-            # and the traceback webpage is returned in the response.
-            self.json = None
-
-        self.text = response.text
         self.elapsed = response.elapsed
         self.headers = response.headers
         self.reason = response.reason
@@ -52,6 +69,43 @@ class Resource(object):
                 elif rel == 'next':
                     self._next_link = link
 
+    def iter_items(self, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Iterate over the items of a collection response.
+
+        Streamed responses are decoded incrementally from the socket, so
+        only one item is held in memory at a time; the body can be
+        iterated over once. Otherwise the already decoded ``json`` is used.
+        In both modes an empty body has no items.
+        :type chunk_size: int
+        :param chunk_size: Number of bytes to read from the socket at once
+        :raises ValueError: If the body is not a JSON array.
+        """
+        if not self.stream:
+            if self.json is not None and not isinstance(self.json, list):
+                raise ValueError('Expected a JSON array')
+            for item in self.json or []:
+                yield item
+            return
+
+        try:
+            for item in iter_json_array(self._response.iter_content(chunk_size)):
+                yield item
+        except CONNECTION_ERRORS as e:
+            raise InternetConnectionError(e)
+        finally:
+            self._response.close()
+
+    def close(self):
+        """Release the connection of a streamed response."""
+        self._response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __repr__(self):
         return '<{} {} {}:{}>'.format(
             self.request.method,
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Gooee.com, LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at:
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "LICENSE" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import unicode_literals
+
+import base64
+import gzip
+import io
+import time
+from collections import defaultdict, deque
+from datetime import timedelta
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from six.moves import urllib_parse
+
+from .compat import json
+from .exceptions import UnrecordedRequest
+
+CASSETTE_VERSION = 1
+REDACTED = '[REDACTED]'
+
+# The body is stored decoded, so these no longer describe it.
+_DROPPED_RESPONSE_HEADERS = (
+    'content-encoding', 'content-length', 'transfer-encoding')
+_CREDENTIAL_PATHS = ('/auth/login',)
+_CREDENTIAL_HEADERS = (
+    'authorization', 'proxy-authenticate', 'set-cookie', 'www-authenticate')
+
+
+def _request_key(method, url, data=None, params=None):
+    """Identify a request by its method, final URL and body."""
+    prepared = requests.Request(
+        method.upper(), url, data=data, params=params).prepare()
+    body = prepared.body
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', 'replace')
+    return prepared.method, prepared.url, body
+
+
+def _encode_body(content):
+    try:
+        return {'body': content.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'body_base64': base64.b64encode(content).decode('ascii')}
+
+
+def _decode_body(response):
+    if 'body_base64' in response:
+        return base64.b64decode(response['body_base64'])
+    return response['body'].encode('utf-8')
+
+
+def redact_credentials(interaction):
+    """
+    Default redaction hook of ``RecordingTransport``.
+
+    Replaces the value of response headers carrying credentials, such as
+    ``Set-Cookie``, the body of login requests, which holds the password,
+    and the ``token`` of their response with ``REDACTED``.
+    """
+    request, response = interaction['request'], interaction['response']
+    for name in response['headers']:
+        if name.lower() in _CREDENTIAL_HEADERS:
+            response['headers'][name] = REDACTED
+
+    path = urllib_parse.urlparse(request['url']).path.rstrip('/')
+    if not path.endswith(_CREDENTIAL_PATHS):
+        return interaction
+
+    if request['body'] is not None:
+        request['body'] = REDACTED
+
+    try:
+        body = json.loads(response.get('body', ''))
+    except ValueError:
+        body = None
+    if isinstance(body, dict) and 'token' in body:
+        body['token'] = REDACTED
+        response['body'] = json.dumps(body)
+    else:
+        response['body'] = REDACTED
+    response.pop('body_base64', None)
+    return interaction
+
+
+def _open(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode)
+    return io.open(path, mode)
+
+
+class RequestsTransport(object):
+    """Send requests over the network with ``requests``."""
+
+    def request(self, method, url, headers=None, data=None, params=None,
+                stream=False):
+        return getattr(requests, method)(
+            url, headers=headers, data=data, params=params, stream=stream)
+
+
+class _ReplayBody(io.BytesIO):
+    """A recorded body that takes ``delay`` seconds to be read in full."""
+
+    def __init__(self, content, delay=0):
+        io.BytesIO.__init__(self, content)
+        self.delay_per_byte = float(delay) / len(content) if content else 0
+
+    def read(self, size=-1):
+        data = io.BytesIO.read(self, size)
+        if self.delay_per_byte and data:
+            time.sleep(len(data) * self.delay_per_byte)
+        return data
+
+
+class RecordingTransport(object):
+    """
+    Record every exchange made through another transport into a cassette.
+
+    Request headers are not recorded, but response headers and request and
+    response bodies are, apart from what ``redact`` removes. The default
+    hook only redacts credential headers such as ``Set-Cookie`` and the
+    password and token of ``/auth/login``: any other secret or personal
+    data ends up in the cassette, so keep cassettes private.
+    Bodies are read in full while recording, so streamed responses are
+    served from memory.
+        >>> from gooee import GooeeClient
+        >>> from gooee.transports import RecordingTransport
+        >>> with RecordingTransport('devices.json.gz') as transport:
+        ...     client = GooeeClient(transport=transport)
+        ...     client.get('/devices')
+    :type path: str
+    :param path: Cassette file, gzip compressed if it ends with ``.gz``
+    :type transport: object
+    :param transport: Transport to record, defaults to ``RequestsTransport``
+    :type redact: callable
+    :param redact: Called with each recorded exchange before it is stored.
+        It may edit the exchange in place or return the one to store. Pass
+        ``None`` to disable redaction.
+    """
+
+    def __init__(self, path, transport=None, redact=redact_credentials):
+        self.path = path
+        self.transport = transport or RequestsTransport()
+        self.redact = redact
+        self.interactions = []
+
+    def request(self, method, url, headers=None, data=None, params=None,
+                stream=False):
+        start = time.time()
+        response = self.transport.request(
+            method, url, headers=headers, data=data, params=params,
+            stream=stream)
+        content = response.content
+        duration = time.time() - start
+
+        method, url, body = _request_key(method, url, data=data, params=params)
+        recorded = {
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': dict(
+                (name, value) for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_RESPONSE_HEADERS),
+        }
+        recorded.update(_encode_body(content))
+        interaction = {
+            'request': {'method': method, 'url': url, 'body': body},
+            'response': recorded,
+            'elapsed': response.elapsed.total_seconds(),
+            'duration': duration,
+        }
+        if self.redact:
+            interaction = self.redact(interaction) or interaction
+        self.interactions.append(interaction)
+        return response
+
+    def save(self):
+        """Write the recorded exchanges to the cassette file."""
+        cassette = {
+            'version': CASSETTE_VERSION,
+            'interactions': self.interactions,
+        }
+        with _open(self.path, 'wb') as f:
+            f.write(json.dumps(cassette, separators=(',', ':')).encode('utf-8'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.save()
+
+
+class ReplayTransport(object):
+    """
+    Serve the exchanges of a cassette without touching the network.
+
+    Requests are matched on their method, URL (including the query string)
+    and body; a redacted body matches any body. Identical requests are
+    answered in the order they were recorded, and each recorded exchange is
+    served once.
+        >>> from gooee import GooeeClient
+        >>> from gooee.transports import ReplayTransport
+        >>> client = GooeeClient(transport=ReplayTransport('devices.json.gz'))
+        >>> client.get('/devices')
+    :type path: str
+    :param path: Cassette file written by ``RecordingTransport``
+    :type latency_scale: float
+    :param latency_scale: Multiplier applied to the recorded timings. The
+        response is returned after the time it took to receive its headers,
+        and the rest of the recorded duration is spread over reading the
+        body. ``0`` answers immediately and ``1`` replays the original
+        latency profile.
+    """
+
+    def __init__(self, path, latency_scale=0):
+        self.path = path
+        self.latency_scale = latency_scale
+
+        with _open(path, 'rb') as f:
+            cassette = json.loads(f.read().decode('utf-8'))
+
+        self.interactions = defaultdict(deque)
+        for interaction in cassette['interactions']:
+            request = interaction['request']
+            key = (request['method'], request['url'], request['body'])
+            self.interactions[key].append(interaction)
+
+    def request(self, method, url, headers=None, data=None, params=None,
+                stream=False):
+        key = _request_key(method, url, data=data, params=params)
+        queue = self.interactions.get(key)
+        if not queue:
+            queue = self.interactions.get((key[0], key[1], REDACTED))
+        if not queue:
+            raise UnrecordedRequest(
+                'No recorded exchange left for {} {}'.format(key[0], key[1]))
+        interaction = queue.popleft()
+
+        elapsed = interaction['elapsed'] * self.latency_scale
+        transfer = max(interaction['duration'] * self.latency_scale - elapsed, 0)
+        if elapsed:
+            time.sleep(elapsed)
+
+        recorded = interaction['response']
+        response = requests.models.Response()
+        response.status_code = recorded['status_code']
+        response.reason = recorded['reason']
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _ReplayBody(_decode_body(recorded), transfer)
+        response.url = key[1]
+        response.elapsed = timedelta(seconds=interaction['elapsed'])
+        response.request = requests.Request(
+            key[0], key[1], headers=headers, data=data).prepare()
+
+        if not stream:
+            # Read the body up front, as requests does for non-streamed calls.
+            response.content
+        return response
@@ -11,16 +11,26 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import codecs
+import itertools
+import re
 from os import environ
 
 from six import string_types
 from six.moves import urllib_parse
 
+from .compat import json
 from .exceptions import InvalidResourcePath
 
 GOOEE_API_URL = environ.get('GOOEE_API_URL', 'https://dev-api.gooee.io/')
 GOOEE_API_PATH = urllib_parse.urlparse(GOOEE_API_URL).path
 
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# What may be left at the end of a chunk when it cuts a number or a \uXXXX
+# escape short, e.g. the "." of "-2.5" or the "e+" of "1e+5".
+_PARTIAL_TOKEN = re.compile(r'(?:[-+.eE0-9]*|u[0-9a-fA-F]{0,4})\Z')
+_LITERALS = ('true', 'false', 'null', 'NaN', 'Infinity', '-Infinity')
+
 
 def format_path(path, api_base_url=GOOEE_API_URL):
     error_msg = 'The path argument must be a string that begins with "/"'
@@ -32,3 +42,115 @@ def format_path(path, api_base_url=GOOEE_API_URL):
         return urllib_parse.urljoin(api_base_url, path.lstrip('/'))
 
     return path
+
+
+def _is_partial(buf, pos):
+    """Whether ``buf[pos:]`` may be a token cut short by the end of a chunk."""
+    tail = buf[pos:]
+    if _PARTIAL_TOKEN.match(tail):
+        return True
+    return any(literal.startswith(tail) for literal in _LITERALS)
+
+
+def _is_incomplete(error, buf):
+    """Whether a decoding error is only caused by running out of input."""
+    pos = getattr(error, 'pos', None)
+    if pos is None:
+        # The decoder does not tell where it failed, assume more data helps.
+        return True
+    return error.msg.startswith('Unterminated string') or _is_partial(buf, pos)
+
+
+def _is_delimited(buf, end):
+    """
+    Whether the array item ending at ``end`` is followed by its delimiter.
+
+    A number such as "-2500." may go on in the next chunk, so an item is
+    only accepted once the "," or "]" after it has been received.
+    """
+    after = _WHITESPACE.match(buf, end).end()
+    if after < len(buf) and buf[after] in ',]':
+        return True
+    if after == len(buf) or _is_partial(buf, end):
+        return False
+    raise ValueError('Expected "," or "]" in JSON array')
+
+
+def _decode_item(decoder, buf, pos):
+    """
+    Decode the array item starting at ``pos``.
+
+    :returns: The item and where it ends, or ``None`` if more data is needed.
+    """
+    try:
+        item, end = decoder.raw_decode(buf, pos)
+    except ValueError as e:
+        if _is_incomplete(e, buf):
+            return None
+        raise
+    return (item, end) if _is_delimited(buf, end) else None
+
+
+def iter_json_array(chunks):
+    """
+    Incrementally decode a top-level JSON array from an iterable of byte
+    chunks, yielding each item as soon as it has been fully received.
+
+    Only the item currently being decoded is buffered, so memory stays
+    bounded by the largest item rather than by the size of the array. An
+    item spanning many chunks is only decoded again once the buffered data
+    has doubled, which keeps large items linear. An empty body is an empty
+    array, as ``Resource`` treats it when it is not streamed.
+
+    :type chunks: iterable of bytes
+    :param chunks: UTF-8 encoded JSON, e.g. ``response.iter_content()``
+    :raises ValueError: If the payload is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buf, pos = '', 0
+    pending, pending_size = [], 0
+    state = 'start'
+
+    # None marks the end of the body, where whatever is pending is decoded.
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            text_decoder.decode(b'', final=True)
+        else:
+            text = text_decoder.decode(chunk)
+            pending.append(text)
+            pending_size += len(text)
+            if pending_size < len(buf) - pos:
+                continue
+
+        buf = buf[pos:] + ''.join(pending)
+        pos, pending, pending_size = 0, [], 0
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos == len(buf):
+                break
+
+            if state == 'start':
+                if buf[pos] != '[':
+                    raise ValueError('Expected a JSON array')
+                pos += 1
+                state = 'first'
+            elif state in ('first', 'item'):
+                if state == 'first' and buf[pos] == ']':
+                    pos += 1
+                    state = 'end'
+                    continue
+                decoded = _decode_item(decoder, buf, pos)
+                if decoded is None:
+                    break
+                item, pos = decoded
+                state = 'separator'
+                yield item
+            elif state == 'separator':
+                state = 'item' if buf[pos] == ',' else 'end'
+                pos += 1
+            else:
+                raise ValueError('Extra data after JSON array')
+
+    if state not in ('start', 'end'):
+        raise ValueError('Truncated JSON array')
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import io
+import json
+from datetime import timedelta
+
+import pytest
+import requests
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
+
+class FakeTransport(object):
+    """Answer each request with the next of the given responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def make_response():
+    """Build a ``requests`` Response serving ``body`` from memory."""
+
+    def make_response(body, status_code=200, headers=None, elapsed=0.1):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        response = requests.models.Response()
+        response.status_code = status_code
+        response.reason = 'OK' if status_code < 400 else 'Error'
+        response.headers.update(headers or {'Content-Type': 'application/json'})
+        response.raw = io.BytesIO(body)
+        response.elapsed = timedelta(seconds=elapsed)
+        response.request = requests.Request('GET', 'https://api.example.com/devices').prepare()
+        response.close = mock.Mock()
+        return response
+
+    return make_response
+
+
+@pytest.fixture
+def fake_transport():
+    """Build a transport answering requests with the given responses."""
+    return FakeTransport
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import pytest
+import requests
+
+from gooee import GooeeClient
+from gooee.exceptions import InternetConnectionError
+from gooee.models import Resource
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
+CONNECTION_ERRORS = [
+    requests.exceptions.ConnectionError('Connection reset'),
+    requests.exceptions.ChunkedEncodingError('Connection broken'),
+]
+
+
+def failing_chunks(chunk, error):
+    yield chunk
+    raise error
+
+
+def test_iter_items_eager(make_response):
+    resource = Resource(make_response([{'id': 1}, {'id': 2}]))
+    assert not resource.stream
+    assert resource.json == [{'id': 1}, {'id': 2}]
+    assert list(resource.iter_items()) == [{'id': 1}, {'id': 2}]
+
+
+def test_iter_items_eager_empty_body(make_response):
+    resource = Resource(make_response(b''))
+    assert resource.json is None
+    assert list(resource.iter_items()) == []
+
+
+def test_iter_items_stream_empty_body(make_response):
+    resource = Resource(make_response(b''), stream=True)
+    assert resource.stream
+    assert list(resource.iter_items()) == []
+
+
+@pytest.mark.parametrize('error', CONNECTION_ERRORS)
+def test_iter_items_stream_connection_error(make_response, error):
+    response = make_response([1, 2])
+    response.iter_content = mock.Mock(return_value=failing_chunks(b'[1, ', error))
+    resource = Resource(response, stream=True)
+
+    items = resource.iter_items()
+    assert next(items) == 1
+    with pytest.raises(InternetConnectionError):
+        next(items)
+    response.close.assert_called_once_with()
+
+
+def test_iter_items_stream(make_response):
+    response = make_response([{'id': 1}, {'id': 2}])
+    resource = Resource(response, stream=True)
+    assert resource.stream
+    assert resource.json is None and resource.text is None
+    assert list(resource.iter_items(chunk_size=3)) == [{'id': 1}, {'id': 2}]
+    response.close.assert_called_once_with()
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_iter_items_not_an_array(stream, make_response):
+    resource = Resource(make_response({'token': 'abc'}), stream=stream)
+    with pytest.raises(ValueError) as excinfo:
+        list(resource.iter_items())
+    assert 'Expected a JSON array' in str(excinfo.value)
+
+
+def test_stream_error_response_is_read_eagerly(make_response):
+    resource = Resource(make_response({'detail': 'Not found.'}, status_code=404), stream=True)
+    assert not resource.stream
+    assert resource.json == {'detail': 'Not found.'}
+    assert 'Not found.' in resource.text
+
+
+def test_close_releases_unconsumed_stream(make_response):
+    response = make_response([1, 2, 3])
+    with Resource(response, stream=True) as resource:
+        assert resource.stream
+    response.close.assert_called_once_with()
+
+
+@pytest.mark.parametrize('args, kwargs', [
+    (({'limit': 5}, True), {}),
+    (({'limit': 5},), {'stream': True}),
+])
+def test_client_get_stream_flag(args, kwargs, make_response, fake_transport):
+    transport = fake_transport(make_response([1, 2]))
+    client = GooeeClient('https://api.example.com/', transport=transport)
+
+    resource = client.get('/devices', *args, **kwargs)
+
+    assert transport.calls[0][2]['stream'] is True
+    assert resource.stream
+    assert list(resource.iter_items()) == [1, 2]
+
+
+@pytest.mark.parametrize('error', CONNECTION_ERRORS)
+def test_client_connection_error(fake_transport, error):
+    transport = fake_transport()
+    transport.request = mock.Mock(side_effect=error)
+    client = GooeeClient('https://api.example.com/', transport=transport)
+
+    with pytest.raises(InternetConnectionError):
+        client.get('/devices')
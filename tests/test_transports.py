@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+
+from gooee import GooeeClient
+from gooee.exceptions import UnrecordedRequest
+from gooee.transports import REDACTED, RecordingTransport, ReplayTransport
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
+API_URL = 'https://api.example.com/'
+
+
+def test_api_token_round_trip(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json.gz'))
+    inner = fake_transport(make_response({'id': 'me'}), make_response([1]))
+    with RecordingTransport(path, transport=inner) as transport:
+        client = GooeeClient(API_URL, transport=transport)
+        client.authenticate(api_token='SECRETTOKEN')
+        client.get('/buildings')
+
+    assert inner.calls[0][2]['headers']['Authorization'] == 'SECRETTOKEN'
+    with gzip.open(path, 'rb') as f:
+        assert b'SECRETTOKEN' not in f.read()
+
+    client = GooeeClient(API_URL, transport=ReplayTransport(path))
+    client.authenticate(api_token='SECRETTOKEN')
+    assert client.get('/buildings').json == [1]
+
+
+def test_round_trip(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json'))
+    link = '<{}devices?page=2>; rel="next"'.format(API_URL)
+    with RecordingTransport(path, transport=fake_transport(
+            make_response([1, 2], headers={'Link': link}),
+            make_response([3]),
+            make_response({'id': 4}, status_code=201))) as transport:
+        client = GooeeClient(API_URL, transport=transport)
+        client.get('/devices', params={'limit': 2})
+        client.get('{}devices?page=2'.format(API_URL))
+        client.post('/devices', data={'name': 'lamp'})
+
+    client = GooeeClient(API_URL, transport=ReplayTransport(path))
+    page = client.get('/devices', params={'limit': 2})
+    assert page.json == [1, 2]
+    assert page._next_link == '{}devices?page=2'.format(API_URL)
+    assert page.elapsed == timedelta(seconds=0.1)
+    assert list(client.get(page._next_link, stream=True).iter_items()) == [3]
+    created = client.post('/devices', data={'name': 'lamp'})
+    assert created.status_code == 201
+    assert created.json == {'id': 4}
+
+
+def test_gzip_cassette(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json.gz'))
+    with RecordingTransport(path, transport=fake_transport(make_response([1]))) as transport:
+        GooeeClient(API_URL, transport=transport).get('/devices')
+
+    with gzip.open(path, 'rb') as f:
+        assert json.loads(f.read().decode('utf-8'))['version'] == 1
+    client = GooeeClient(API_URL, transport=ReplayTransport(path))
+    assert client.get('/devices').json == [1]
+
+
+def test_identical_requests_are_replayed_in_order(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json'))
+    with RecordingTransport(path, transport=fake_transport(
+            make_response([1]), make_response([2]))) as transport:
+        client = GooeeClient(API_URL, transport=transport)
+        client.get('/devices')
+        client.get('/devices')
+
+    client = GooeeClient(API_URL, transport=ReplayTransport(path))
+    assert client.get('/devices').json == [1]
+    assert client.get('/devices').json == [2]
+    with pytest.raises(UnrecordedRequest):
+        client.get('/devices')
+
+
+def test_unrecorded_request(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json'))
+    with RecordingTransport(path, transport=fake_transport(make_response([1]))) as transport:
+        GooeeClient(API_URL, transport=transport).get('/devices')
+
+    client = GooeeClient(API_URL, transport=ReplayTransport(path))
+    with pytest.raises(UnrecordedRequest):
+        client.get('/devices', params={'limit': 5})
+    with pytest.raises(UnrecordedRequest):
+        client.post('/devices', data={'name': 'lamp'})
+
+
+def test_binary_body(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json'))
+    content = b'\x89PNG\r\n\x1a\n\xff\x00'
+    with RecordingTransport(path, transport=fake_transport(
+            make_response(content, headers={'Content-Type': 'image/png'}))) as transport:
+        GooeeClient(API_URL, transport=transport).get('/logo')
+
+    with open(path) as f:
+        assert 'body_base64' in json.load(f)['interactions'][0]['response']
+    response = ReplayTransport(path).request('get', API_URL + 'logo')
+    assert response.content == content
+
+
+def test_encoding_headers_are_not_recorded(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json'))
+    headers = {'Content-Type': 'application/json', 'Content-Encoding': 'gzip',
+               'content-length': '42'}
+    with RecordingTransport(path, transport=fake_transport(
+            make_response([1], headers=headers))) as transport:
+        GooeeClient(API_URL, transport=transport).get('/devices')
+
+    response = ReplayTransport(path).request('get', API_URL + 'devices')
+    assert dict(response.headers) == {'Content-Type': 'application/json'}
+
+
+def test_login_credentials_are_redacted(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json.gz'))
+    headers = {'Content-Type': 'application/json',
+               'Set-Cookie': 'sessionid=SECRETSESSION; HttpOnly'}
+    with RecordingTransport(path, transport=fake_transport(
+            make_response({'token': 'SECRETJWT'}, headers=headers))) as transport:
+        client = GooeeClient(API_URL, transport=transport)
+        client.authenticate('user@example.com', 'hunter2')
+
+    with gzip.open(path, 'rb') as f:
+        raw = f.read()
+    assert b'hunter2' not in raw
+    assert b'SECRETJWT' not in raw
+    assert b'SECRETSESSION' not in raw
+
+    client = GooeeClient(API_URL, transport=ReplayTransport(path))
+    client.authenticate('someone@example.com', 'anything')
+    assert client.auth_token == 'JWT {}'.format(REDACTED)
+
+
+def test_redaction_can_be_disabled(tmpdir, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json'))
+    with RecordingTransport(path, transport=fake_transport(
+            make_response({'token': 'SECRETJWT'})), redact=None) as transport:
+        GooeeClient(API_URL, transport=transport).authenticate('user@example.com', 'hunter2')
+
+    with open(path) as f:
+        raw = f.read()
+    assert 'hunter2' in raw
+    assert 'SECRETJWT' in raw
+
+
+def test_redact_hook_editing_in_place(tmpdir, make_response, fake_transport):
+    def redact(interaction):
+        interaction['response']['body'] = REDACTED
+
+    path = str(tmpdir.join('cassette.json'))
+    with RecordingTransport(path, transport=fake_transport(
+            make_response([1])), redact=redact) as transport:
+        GooeeClient(API_URL, transport=transport).get('/devices')
+
+    response = ReplayTransport(path).request('get', API_URL + 'devices')
+    assert response.text == REDACTED
+
+
+@pytest.mark.parametrize('latency_scale', [0, 1, 2])
+def test_latency_scale(tmpdir, latency_scale, make_response, fake_transport):
+    path = str(tmpdir.join('cassette.json'))
+    with RecordingTransport(path, transport=fake_transport(make_response([1, 2]))) as transport:
+        GooeeClient(API_URL, transport=transport).get('/devices')
+    with open(path) as f:
+        cassette = json.load(f)
+    cassette['interactions'][0]['elapsed'] = 0.25
+    cassette['interactions'][0]['duration'] = 1.0
+    with open(path, 'w') as f:
+        json.dump(cassette, f)
+
+    transport = ReplayTransport(path, latency_scale=latency_scale)
+    with mock.patch('gooee.transports.time.sleep') as sleep:
+        response = transport.request('get', API_URL + 'devices', stream=True)
+        headers_delay = sum(call[0][0] for call in sleep.call_args_list)
+        response.content
+        body_delay = sum(call[0][0] for call in sleep.call_args_list) - headers_delay
+
+    assert headers_delay == pytest.approx(0.25 * latency_scale)
+    assert body_delay == pytest.approx(0.75 * latency_scale)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import json
+
+import pytest
+
+from gooee.utils import iter_json_array
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
+
+def chunked(payload, size):
+    if not isinstance(payload, bytes):
+        payload = payload.encode('utf-8')
+    return [payload[i:i + size] for i in range(0, len(payload), size)]
+
+
+ITEMS = [
+    1, -2.5e3, 1.5, 1e5, -0.0, 3.14159e-10, 12345678901234567890,
+    'plain', 'é€😀 "quoted" \\ backslash',
+    {'a': [True, False, None, {'b': 'ሴ'}]},
+    [], {},
+]
+
+
+@pytest.mark.parametrize('ensure_ascii', [True, False])
+def test_iter_json_array_every_chunk_size(ensure_ascii):
+    payload = json.dumps(ITEMS, ensure_ascii=ensure_ascii).encode('utf-8')
+    for size in range(1, len(payload) + 1):
+        assert list(iter_json_array(chunked(payload, size))) == ITEMS, size
+
+
+@pytest.mark.parametrize('payload', ['[1.5, 2]', '[1e5, 2]', '[-2500.5]'])
+def test_iter_json_array_numbers_split_across_chunks(payload):
+    for size in range(1, len(payload) + 1):
+        assert list(iter_json_array(chunked(payload, size))) == json.loads(payload)
+
+
+def test_iter_json_array_multibyte_utf8_split_across_chunks():
+    payload = '["€", "😀"]'.encode('utf-8')
+    assert list(iter_json_array([payload[:3], payload[3:9], payload[9:]])) == ['€', '😀']
+
+
+@pytest.mark.parametrize('payload', ['[]', ' [ ] ', '\n[\n]\n', '', ' '])
+def test_iter_json_array_empty(payload):
+    assert list(iter_json_array(chunked(payload, 1))) == []
+
+
+def test_iter_json_array_item_larger_than_chunks():
+    item = {'devices': [{'id': i, 'name': 'Device {}'.format(i)} for i in range(5000)]}
+    payload = json.dumps([1, item, 2])
+    chunks = chunked(payload, 64)
+    raw_decode = json.JSONDecoder.raw_decode
+
+    with mock.patch.object(json.JSONDecoder, 'raw_decode', autospec=True,
+                           side_effect=raw_decode) as decode:
+        assert list(iter_json_array(chunks)) == [1, item, 2]
+
+    # The large item is only decoded again once the buffer has doubled.
+    assert len(chunks) > 2000
+    assert decode.call_count < 40
+
+
+def test_iter_json_array_yields_items_as_they_arrive():
+    items = iter_json_array(iter([b'[{"id": 1}, ', b'{"id"']))
+    assert next(items) == {'id': 1}
+
+
+@pytest.mark.parametrize('payload, message', [
+    ('{"a": 1}', 'Expected a JSON array'),
+    ('[1 2]', 'Expected "," or "]"'),
+    ('[1.x]', 'Expected "," or "]"'),
+    ('[1] 2', 'Extra data'),
+    ('[1, 2', 'Truncated'),
+    ('[', 'Truncated'),
+    ('[1,]', 'Expecting value'),
+    ('[,1]', 'Expecting value'),
+    ('[nul]', 'Expecting value'),
+    ('["a\\x"]', 'Invalid \\escape'),
+])
+def test_iter_json_array_errors(payload, message):
+    for size in (1, 3, len(payload) or 1):
+        with pytest.raises(ValueError) as excinfo:
+            list(iter_json_array(chunked(payload, size)))
+        assert message in str(excinfo.value)
+
+
+def test_iter_json_array_malformed_item_fails_before_reading_the_rest():
+    def chunks():
+        yield b'[1, {"a": tru}, '
+        pytest.fail('Read past the malformed item')
+
+    items = iter_json_array(chunks())
+    assert next(items) == 1
+    with pytest.raises(ValueError):
+        next(items)
+
+
+@pytest.mark.parametrize('payload', [b'[1, "\xc3', b'["\xc3"]'])
+def test_iter_json_array_invalid_utf8(payload):
+    with pytest.raises(UnicodeDecodeError):
+        list(iter_json_array([payload]))